@@ -73,6 +73,14 @@ class Comparator(object):
         # :var dest_take: Take the next dest file from the generated files if
         #     true
         dest_take = True
+        # Bind the strategies' methods once as they are called for every
+        # file that is compared.
+        should_sync_at_src_and_dest = \
+            self._sync_strategy.determine_should_sync
+        should_sync_not_at_dest = \
+            self._not_at_dest_sync_strategy.determine_should_sync
+        should_sync_not_at_src = \
+            self._not_at_src_sync_strategy.determine_should_sync
         while True:
             try:
                 if (not src_done) and src_take:
@@ -94,34 +102,33 @@ class Comparator(object):
                 compare_keys = self.compare_comp_key(src_file, dest_file)
 
                 if compare_keys == 'equal':
-                    should_sync = self._sync_strategy.determine_should_sync(
-                        src_file, dest_file
-                    )
+                    should_sync = should_sync_at_src_and_dest(
+                        src_file, dest_file)
                     if should_sync:
                         yield src_file
                 elif compare_keys == 'less_than':
                     src_take = True
                     dest_take = False
-                    should_sync = self._not_at_dest_sync_strategy.determine_should_sync(src_file, None)
+                    should_sync = should_sync_not_at_dest(src_file, None)
                     if should_sync:
                         yield src_file
 
                 elif compare_keys == 'greater_than':
                     src_take = False
                     dest_take = True
-                    should_sync = self._not_at_src_sync_strategy.determine_should_sync(None, dest_file)
+                    should_sync = should_sync_not_at_src(None, dest_file)
                     if should_sync:
                         yield dest_file
 
             elif (not src_done) and dest_done:
                 src_take = True
-                should_sync = self._not_at_dest_sync_strategy.determine_should_sync(src_file, None)
+                should_sync = should_sync_not_at_dest(src_file, None)
                 if should_sync:
                     yield src_file
 
             elif src_done and (not dest_done):
                 dest_take = True
-                should_sync = self._not_at_src_sync_strategy.determine_should_sync(None, dest_file)
+                should_sync = should_sync_not_at_src(None, dest_file)
                 if should_sync:
                     yield dest_file
             else:
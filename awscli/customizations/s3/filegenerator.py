@@ -93,6 +93,11 @@ class FileDecodingError(Exception):
 
 
 class FileStat(object):
+    # A ``FileStat`` is created for every file listed at the source and the
+    # destination of a sync, so skip the per-instance ``__dict__``.
+    __slots__ = ('src', 'dest', 'compare_key', 'size', 'last_update',
+                 'src_type', 'dest_type', 'operation_name', 'response_data')
+
     def __init__(self, src, dest=None, compare_key=None, size=None,
                  last_update=None, src_type=None, dest_type=None,
                  operation_name=None, response_data=None):
@@ -11,12 +11,27 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 import logging
+import operator
 
 
 LOG = logging.getLogger(__name__)
 
-VALID_SYNC_TYPES = ['file_at_src_and_dest', 'file_not_at_dest',
-                    'file_not_at_src']
+# Ordered for display in error messages.
+_VALID_SYNC_TYPES_DISPLAY = ('file_at_src_and_dest', 'file_not_at_dest',
+                             'file_not_at_src')
+
+VALID_SYNC_TYPES = frozenset(_VALID_SYNC_TYPES_DISPLAY)
+
+# Maps an operation to the comparison of the destination's last modified
+# time against the source's that means the file does not need updating.
+# Uploads and copies are up to date when the destination is at least as
+# new as the source. Downloads are up to date when the local destination
+# is not newer than the source.
+_TIME_COMPARISONS = {
+    'upload': operator.ge,
+    'copy': operator.ge,
+    'download': operator.le,
+}
 
 
 class BaseSync(object):
@@ -67,7 +82,7 @@ class BaseSync(object):
         if sync_type not in VALID_SYNC_TYPES:
             raise ValueError("Unknown sync_type: %s.\n"
                              "Valid options are %s." %
-                             (sync_type, VALID_SYNC_TYPES))
+                             (sync_type, list(_VALID_SYNC_TYPES_DISPLAY)))
 
     @property
     def sync_type(self):
@@ -179,12 +194,11 @@ class BaseSync(object):
 
     def total_seconds(self, td):
         """
-        timedelta's time_seconds() function for python 2.6 users
+        Kept for backwards compatibility, use ``td.total_seconds()``.
 
         :param td: The difference between two datetime objects.
         """
-        return (td.microseconds + (td.seconds + td.days * 24 *
-                                   3600) * 10**6) / 10**6
+        return td.total_seconds()
 
     def compare_size(self, src_file, dest_file):
         """
@@ -200,36 +214,22 @@ class BaseSync(object):
             False if the file does need updating based on the time of
             last modification and type of operation.
         """
-        src_time = src_file.last_update
-        dest_time = dest_file.last_update
-        delta = dest_time - src_time
         cmd = src_file.operation_name
-        if cmd == "upload" or cmd == "copy":
-            if self.total_seconds(delta) >= 0:
-                # Destination is newer than source.
-                return True
-            else:
-                # Destination is older than source, so
-                # we have a more recently updated file
-                # at the source location.
-                return False
-        elif cmd == "download":
-
-            if self.total_seconds(delta) <= 0:
-                return True
-            else:
-                # delta is positive, so the destination
-                # is newer than the source.
-                return False
+        try:
+            compare = _TIME_COMPARISONS[cmd]
+        except KeyError:
+            raise ValueError("Unknown operation for time comparison: %s" % cmd)
+        return compare(dest_file.last_update, src_file.last_update)
 
 
 class SizeAndLastModifiedSync(BaseSync):
 
     def determine_should_sync(self, src_file, dest_file):
-        same_size = self.compare_size(src_file, dest_file)
-        same_last_modified_time = self.compare_time(src_file, dest_file)
-        should_sync = (not same_size) or (not same_last_modified_time)
-        if should_sync:
+        # A size mismatch alone forces a sync, so only compare the last
+        # modified times when the sizes match.
+        should_sync = (not self.compare_size(src_file, dest_file)) or \
+            (not self.compare_time(src_file, dest_file))
+        if should_sync and LOG.isEnabledFor(logging.DEBUG):
             LOG.debug(
                 "syncing: %s -> %s, size: %s -> %s, modified time: %s -> %s",
                 src_file.src, src_file.dest,
@@ -251,6 +251,7 @@ class MissingFileSync(BaseSync):
         super(MissingFileSync, self).__init__(sync_type)
 
     def determine_should_sync(self, src_file, dest_file):
-        LOG.debug("syncing: %s -> %s, file does not exist at destination",
-                  src_file.src, src_file.dest)
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("syncing: %s -> %s, file does not exist at destination",
+                      src_file.src, src_file.dest)
         return True
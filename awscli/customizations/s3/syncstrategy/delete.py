@@ -30,7 +30,8 @@ class DeleteSync(BaseSync):
 
     def determine_should_sync(self, src_file, dest_file):
         dest_file.operation_name = 'delete'
-        LOG.debug("syncing: (None) -> %s (remove), file does not "
-                  "exist at source (%s) and delete mode enabled",
-                  dest_file.src, dest_file.dest)
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("syncing: (None) -> %s (remove), file does not "
+                      "exist at source (%s) and delete mode enabled",
+                      dest_file.src, dest_file.dest)
         return True
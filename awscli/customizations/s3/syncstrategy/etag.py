@@ -0,0 +1,194 @@
+# Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import logging
+
+from botocore.compat import get_md5
+from botocore.exceptions import MD5UnavailableError
+from s3transfer.utils import ChunksizeAdjuster
+
+from awscli.customizations.s3.syncstrategy.base import SizeAndLastModifiedSync
+from awscli.customizations.s3.transferconfig import DEFAULTS, RuntimeConfig
+
+
+LOG = logging.getLogger(__name__)
+
+READ_BLOCK_SIZE = 1024 * 1024
+
+
+ETAG = {'name': 'etag', 'action': 'store_true',
+        'help_text': (
+            'Same-sized items will be synced only when the ETag of the S3 '
+            'object does not match the MD5 of the local file, or the ETag '
+            'of the other S3 object when syncing from S3 to S3. ETags of '
+            'multipart uploads are compared assuming the configured '
+            'multipart chunk size. When the ETags cannot be compared, the '
+            'default size and last modified time comparison is used. This '
+            'includes S3 to S3 syncs where either object was uploaded in '
+            'parts and the ETags differ. Objects whose ETag is not an MD5 '
+            'of their content, such as objects encrypted with SSE-KMS, are '
+            'always synced.')}
+
+
+class ETagSync(SizeAndLastModifiedSync):
+
+    ARGUMENT = ETAG
+
+    def __init__(self, sync_type='file_at_src_and_dest'):
+        super(ETagSync, self).__init__(sync_type)
+        self._session = None
+        self._multipart_chunksize = None
+
+    def register_strategy(self, session):
+        super(ETagSync, self).register_strategy(session)
+        # The chunk size is resolved on first use as the scoped config is
+        # not final until the command line has been parsed.
+        self._session = session
+
+    @property
+    def multipart_chunksize(self):
+        if self._multipart_chunksize is None:
+            chunksize = DEFAULTS['multipart_chunksize']
+            if self._session is not None:
+                runtime_config = RuntimeConfig().build_config(
+                    **self._session.get_scoped_config().get('s3', {}))
+                chunksize = runtime_config['multipart_chunksize']
+            self._multipart_chunksize = chunksize
+        return self._multipart_chunksize
+
+    def determine_should_sync(self, src_file, dest_file):
+        if src_file.size != dest_file.size:
+            # Different sizes always need a sync, so there is no need to
+            # read the local file to compute its MD5.
+            if LOG.isEnabledFor(logging.DEBUG):
+                LOG.debug("syncing: %s -> %s, size: %s -> %s",
+                          src_file.src, src_file.dest,
+                          src_file.size, dest_file.size)
+            return True
+        same_etag = self.compare_etag(src_file, dest_file)
+        if same_etag is None:
+            return super(ETagSync, self).determine_should_sync(
+                src_file, dest_file)
+        should_sync = not same_etag
+        if should_sync and LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("syncing: %s -> %s, etag_changed: %s",
+                      src_file.src, src_file.dest, should_sync)
+        return should_sync
+
+    def compare_etag(self, src_file, dest_file):
+        """
+        :returns: True if the ETags match. False if they do not match.
+            None if the ETags cannot be compared.
+        """
+        cmd = src_file.operation_name
+        if cmd == 'copy':
+            src_etag = _get_etag(src_file)
+            dest_etag = _get_etag(dest_file)
+            if src_etag is None or dest_etag is None:
+                return None
+            if src_etag == dest_etag:
+                return True
+            if '-' in src_etag or '-' in dest_etag:
+                # A multipart ETag depends on how the object was split into
+                # parts, so differing ETags do not mean differing contents.
+                return None
+            return False
+        elif cmd == 'upload':
+            local_file, s3_file = src_file, dest_file
+        elif cmd == 'download':
+            local_file, s3_file = dest_file, src_file
+        else:
+            return None
+        s3_etag = _get_etag(s3_file)
+        if s3_etag is None:
+            return None
+        try:
+            local_etag = _compute_local_etag(
+                local_file.src, local_file.size, s3_etag,
+                self.multipart_chunksize)
+        except MD5UnavailableError:
+            LOG.debug("MD5 is unavailable, unable to compare ETags for %s",
+                      local_file.src)
+            return None
+        except (OSError, IOError) as e:
+            # The file may have been removed or become unreadable since it
+            # was listed. Leave it to the transfer to warn about it.
+            LOG.debug("Unable to compute the ETag of %s: %s",
+                      local_file.src, e)
+            return None
+        if local_etag is None:
+            return None
+        return local_etag == s3_etag
+
+
+def _get_etag(file_stat):
+    # The ETag is only present on ``FileStat`` objects listed from S3.
+    response_data = file_stat.response_data
+    if not response_data:
+        return None
+    etag = response_data.get('ETag')
+    if not etag:
+        return None
+    return etag.strip('"')
+
+
+def _compute_local_etag(path, size, s3_etag, multipart_chunksize):
+    # Computes the ETag S3 would assign to the contents of ``path`` if
+    # it was uploaded the same way as the object with ``s3_etag``.
+    if '-' not in s3_etag:
+        return _md5_etag(path)
+    try:
+        num_parts = int(s3_etag.rsplit('-', 1)[1])
+    except ValueError:
+        return None
+    chunksize = ChunksizeAdjuster().adjust_chunksize(
+        multipart_chunksize, size)
+    if _num_parts(size, chunksize) != num_parts:
+        # The object was not uploaded with the configured chunk size, so
+        # the ETag cannot be reproduced.
+        return None
+    return _mpu_etag(path, chunksize)
+
+
+def _num_parts(size, chunksize):
+    return max(1, -(-size // chunksize))
+
+
+def _md5_etag(path):
+    md5 = get_md5()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(READ_BLOCK_SIZE), b''):
+            md5.update(block)
+    return md5.hexdigest()
+
+
+def _mpu_etag(path, chunksize):
+    # The ETag of a multipart upload is the MD5 of the concatenated
+    # binary MD5s of each part, followed by the number of parts.
+    part_digests = []
+    with open(path, 'rb') as f:
+        while True:
+            md5 = get_md5()
+            remaining = chunksize
+            while remaining > 0:
+                block = f.read(min(READ_BLOCK_SIZE, remaining))
+                if not block:
+                    break
+                md5.update(block)
+                remaining -= len(block)
+            if remaining == chunksize:
+                break
+            part_digests.append(md5.digest())
+            if remaining > 0:
+                break
+    combined = get_md5(b''.join(part_digests))
+    return '%s-%s' % (combined.hexdigest(), len(part_digests))
@@ -32,12 +32,8 @@ class ExactTimestampsSync(SizeAndLastModifiedSync):
     ARGUMENT = EXACT_TIMESTAMPS
 
     def compare_time(self, src_file, dest_file):
-        src_time = src_file.last_update
-        dest_time = dest_file.last_update
-        delta = dest_time - src_time
-        cmd = src_file.operation_name
-        if cmd == 'download':
-            return self.total_seconds(delta) == 0
+        if src_file.operation_name == 'download':
+            return dest_file.last_update == src_file.last_update
         else:
             return super(ExactTimestampsSync, self).compare_time(src_file,
                                                                  dest_file)
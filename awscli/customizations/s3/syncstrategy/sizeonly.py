@@ -29,9 +29,8 @@ class SizeOnlySync(BaseSync):
     ARGUMENT = SIZE_ONLY
 
     def determine_should_sync(self, src_file, dest_file):
-        same_size = self.compare_size(src_file, dest_file)
-        should_sync = not same_size
-        if should_sync:
+        should_sync = not self.compare_size(src_file, dest_file)
+        if should_sync and LOG.isEnabledFor(logging.DEBUG):
             LOG.debug("syncing: %s -> %s, size_changed: %s",
-                      src_file.src, src_file.dest, not same_size)
+                      src_file.src, src_file.dest, should_sync)
         return should_sync
@@ -10,7 +10,9 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import hashlib
 import os
+import time
 
 from awscli.compat import six
 from awscli.testutils import mock
@@ -223,6 +225,72 @@ class TestSyncCommand(BaseS3TransferCommandTest):
         self.assertEqual(len(self.operations_called), 1, self.operations_called)
         self.assertEqual(self.operations_called[0][0].name, 'ListObjectsV2')
 
+    def etag_list_objects_response(self, key, contents):
+        return {
+            'Contents': [{
+                'Key': key,
+                'LastModified': '00:00:00Z',
+                'Size': len(contents),
+                'ETag': '"%s"' % hashlib.md5(contents).hexdigest(),
+            }],
+            'CommonPrefixes': []
+        }
+
+    def test_sync_with_etag_skips_matching_etag(self):
+        # The local file is newer than the object, so it would be uploaded
+        # by the default sync strategy.
+        self.files.create_file(
+            'foo.txt', b'mycontent', mtime=time.time(), mode='wb')
+        cmdline = '%s %s s3://bucket/ --etag' % (
+            self.prefix, self.files.rootdir)
+        self.parsed_responses = [
+            self.etag_list_objects_response('foo.txt', b'mycontent'),
+        ]
+        self.run_cmd(cmdline, expected_rc=0)
+        self.assertEqual(len(self.operations_called), 1, self.operations_called)
+        self.assertEqual(self.operations_called[0][0].name, 'ListObjectsV2')
+
+    def test_sync_with_etag_uploads_changed_etag(self):
+        self.files.create_file('foo.txt', b'mycontent', mode='wb')
+        cmdline = '%s %s s3://bucket/ --etag' % (
+            self.prefix, self.files.rootdir)
+        self.parsed_responses = [
+            self.etag_list_objects_response('foo.txt', b'othertext'),
+            {'ETag': '"c8afdb36c52cf4727836669019e69222"'}
+        ]
+        self.run_cmd(cmdline, expected_rc=0)
+        self.assertEqual(len(self.operations_called), 2, self.operations_called)
+        self.assertEqual(self.operations_called[0][0].name, 'ListObjectsV2')
+        self.assertEqual(self.operations_called[1][0].name, 'PutObject')
+        self.assertEqual(self.operations_called[1][1]['Key'], 'foo.txt')
+
+    def test_sync_with_etag_continues_when_file_deleted_before_hashing(self):
+        self.files.create_file('a.txt', b'mycontent', mode='wb')
+        self.files.create_file('b.txt', b'newcontent', mode='wb')
+        cmdline = '%s %s s3://bucket/ --etag' % (
+            self.prefix, self.files.rootdir)
+        self.parsed_responses = [
+            self.etag_list_objects_response('a.txt', b'mycontent'),
+            {'ETag': '"c8afdb36c52cf4727836669019e69222"'}
+        ]
+
+        # The file is removed after it has been listed but before its MD5
+        # can be computed. This falls back to comparing the last modified
+        # times and the rest of the sync carries on.
+        def side_effect(path):
+            os.remove(path)
+            raise OSError()
+        with mock.patch(
+                'awscli.customizations.s3.syncstrategy.etag._md5_etag',
+                side_effect=side_effect
+                ):
+            self.run_cmd(cmdline, expected_rc=0)
+
+        self.assertEqual(len(self.operations_called), 2, self.operations_called)
+        self.assertEqual(self.operations_called[0][0].name, 'ListObjectsV2')
+        self.assertEqual(self.operations_called[1][0].name, 'PutObject')
+        self.assertEqual(self.operations_called[1][1]['Key'], 'b.txt')
+
     def test_request_payer(self):
         cmdline = '%s s3://sourcebucket/ s3://mybucket --request-payer' % (
             self.prefix)
@@ -71,6 +71,19 @@ class TestBaseSync(unittest.TestCase):
         self.sync_strategy.ARGUMENT = {'dest': 'my-dest'}
         self.assertEqual(self.sync_strategy.arg_dest, 'my-dest')
 
+    def test_use_sync_strategy_respects_overridden_arg_name(self):
+        """
+        Test that ``use_sync_strategy`` resolves the argument through the
+        ``arg_name`` property so subclasses can override it.
+        """
+        class MySync(BaseSync):
+            arg_name = 'my-sync-strategy'
+
+        sync_strategy = MySync()
+        params = {'my_sync_strategy': True}
+        self.assertEqual(sync_strategy.use_sync_strategy(params),
+                         sync_strategy)
+
     def test_add_sync_argument(self):
         """
         Ensures the sync argument is properly added to the
@@ -180,6 +193,47 @@ class TestSizeAndLastModifiedSync(unittest.TestCase):
             src_file, dest_file)
         self.assertTrue(should_sync)
 
+    def test_size_mismatch_skips_time_comparison(self):
+        """
+        Confirms the last modified times are not compared when the sizes
+        already differ.
+        """
+        time = datetime.datetime.now()
+        src_file = FileStat(src='', dest='',
+                            compare_key='comparator_test.py', size=11,
+                            last_update=time, src_type='local',
+                            dest_type='s3', operation_name='upload')
+        dest_file = FileStat(src='', dest='',
+                             compare_key='comparator_test.py', size=10,
+                             last_update=time, src_type='s3',
+                             dest_type='local', operation_name='')
+        with mock.patch.object(self.sync_strategy, 'compare_time') as time_cmp:
+            should_sync = self.sync_strategy.determine_should_sync(
+                src_file, dest_file)
+        self.assertTrue(should_sync)
+        self.assertFalse(time_cmp.called)
+
+    def test_overridden_compare_size_is_used(self):
+        """
+        Confirms a subclass overriding ``compare_size`` is respected.
+        """
+        class IgnoreSizeSync(SizeAndLastModifiedSync):
+            def compare_size(self, src_file, dest_file):
+                return True
+
+        time = datetime.datetime.now()
+        src_file = FileStat(src='', dest='',
+                            compare_key='comparator_test.py', size=11,
+                            last_update=time, src_type='local',
+                            dest_type='s3', operation_name='upload')
+        dest_file = FileStat(src='', dest='',
+                             compare_key='comparator_test.py', size=10,
+                             last_update=time, src_type='s3',
+                             dest_type='local', operation_name='')
+        should_sync = IgnoreSizeSync().determine_should_sync(
+            src_file, dest_file)
+        self.assertFalse(should_sync)
+
     def test_compare_lastmod_upload(self):
         """
         Confirms compare time works for uploads.
@@ -249,6 +303,23 @@ class TestSizeAndLastModifiedSync(unittest.TestCase):
             src_file, dest_file)
         self.assertFalse(should_sync)
 
+    def test_compare_time_unknown_operation(self):
+        """
+        Confirms an unknown operation is rejected rather than silently
+        treated as needing a sync.
+        """
+        time = datetime.datetime.now()
+        src_file = FileStat(src='', dest='',
+                            compare_key='comparator_test.py', size=10,
+                            last_update=time, src_type='local',
+                            dest_type='s3', operation_name='unknown')
+        dest_file = FileStat(src='', dest='',
+                             compare_key='comparator_test.py', size=10,
+                             last_update=time, src_type='s3',
+                             dest_type='local', operation_name='')
+        with self.assertRaises(ValueError):
+            self.sync_strategy.compare_time(src_file, dest_file)
+
 
 class TestNeverSync(unittest.TestCase):
     def setUp(self):
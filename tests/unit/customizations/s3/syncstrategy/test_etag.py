@@ -0,0 +1,235 @@
+# Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import datetime
+import hashlib
+import os
+
+from botocore.exceptions import MD5UnavailableError
+
+from awscli.customizations.s3.filegenerator import FileStat
+from awscli.customizations.s3.syncstrategy.etag import ETagSync, _mpu_etag
+from awscli.testutils import FileCreator, mock, unittest
+
+
+MB = 1024 ** 2
+
+
+def multipart_etag(contents, chunksize):
+    part_digests = [
+        hashlib.md5(contents[i:i + chunksize]).digest()
+        for i in range(0, len(contents), chunksize)
+    ]
+    return '%s-%s' % (hashlib.md5(b''.join(part_digests)).hexdigest(),
+                      len(part_digests))
+
+
+class TestETagSync(unittest.TestCase):
+    def setUp(self):
+        self.sync_strategy = ETagSync()
+        self.files = FileCreator()
+        self.contents = b'foobar'
+        self.local_path = self.files.create_file(
+            'foo.txt', self.contents, mode='wb')
+        self.md5 = hashlib.md5(self.contents).hexdigest()
+        self.time = datetime.datetime.now()
+
+    def tearDown(self):
+        self.files.remove_all()
+
+    def local_file(self, operation_name='', size=None, last_update=None):
+        if size is None:
+            size = len(self.contents)
+        if last_update is None:
+            last_update = self.time
+        return FileStat(src=self.local_path, dest='',
+                        compare_key='foo.txt', size=size,
+                        last_update=last_update, src_type='local',
+                        operation_name=operation_name)
+
+    def s3_file(self, etag, operation_name='', size=None, last_update=None):
+        if size is None:
+            size = len(self.contents)
+        if last_update is None:
+            last_update = self.time
+        response_data = None
+        if etag is not None:
+            response_data = {'ETag': '"%s"' % etag}
+        return FileStat(src='bucket/foo.txt', dest='',
+                        compare_key='foo.txt', size=size,
+                        last_update=last_update, src_type='s3',
+                        operation_name=operation_name,
+                        response_data=response_data)
+
+    def test_upload_same_etag_newer_source(self):
+        """
+        Confirm that a newer local file is not uploaded when its MD5
+        matches the ETag.
+        """
+        future_time = self.time + datetime.timedelta(days=1)
+        src_file = self.local_file('upload', last_update=future_time)
+        dest_file = self.s3_file(self.md5)
+        self.assertFalse(
+            self.sync_strategy.determine_should_sync(src_file, dest_file))
+
+    def test_upload_different_etag(self):
+        src_file = self.local_file('upload')
+        dest_file = self.s3_file('0' * 32)
+        self.assertTrue(
+            self.sync_strategy.determine_should_sync(src_file, dest_file))
+
+    def test_upload_different_size(self):
+        src_file = self.local_file('upload')
+        dest_file = self.s3_file(self.md5, size=len(self.contents) + 1)
+        self.assertTrue(
+            self.sync_strategy.determine_should_sync(src_file, dest_file))
+
+    def test_download_same_etag_newer_destination(self):
+        future_time = self.time + datetime.timedelta(days=1)
+        src_file = self.s3_file(self.md5, 'download')
+        dest_file = self.local_file(last_update=future_time)
+        self.assertFalse(
+            self.sync_strategy.determine_should_sync(src_file, dest_file))
+
+    def test_download_different_etag(self):
+        src_file = self.s3_file('0' * 32, 'download')
+        dest_file = self.local_file()
+        self.assertTrue(
+            self.sync_strategy.determine_should_sync(src_file, dest_file))
+
+    def test_copy_compares_etags(self):
+        src_file = self.s3_file(self.md5, 'copy')
+        self.assertFalse(self.sync_strategy.determine_should_sync(
+            src_file, self.s3_file(self.md5)))
+        self.assertTrue(self.sync_strategy.determine_should_sync(
+            src_file, self.s3_file('0' * 32)))
+
+    def test_copy_same_multipart_etags(self):
+        etag = '0' * 32 + '-2'
+        src_file = self.s3_file(etag, 'copy')
+        self.assertFalse(self.sync_strategy.determine_should_sync(
+            src_file, self.s3_file(etag)))
+
+    def test_copy_different_multipart_etags_fall_back(self):
+        """
+        Confirm that differing ETags are not trusted for S3 to S3 syncs
+        when either object was uploaded in parts.
+        """
+        future_time = self.time + datetime.timedelta(days=1)
+        src_file = self.s3_file('0' * 32 + '-2', 'copy')
+        dest_file = self.s3_file('1' * 32 + '-3', last_update=future_time)
+        self.assertFalse(
+            self.sync_strategy.determine_should_sync(src_file, dest_file))
+
+        src_file = self.s3_file(self.md5, 'copy')
+        dest_file = self.s3_file('1' * 32 + '-2', last_update=future_time)
+        self.assertFalse(
+            self.sync_strategy.determine_should_sync(src_file, dest_file))
+
+        newer_time = future_time + datetime.timedelta(days=1)
+        src_file = self.s3_file(self.md5, 'copy', last_update=newer_time)
+        self.assertTrue(
+            self.sync_strategy.determine_should_sync(src_file, dest_file))
+
+    def test_missing_etag_falls_back_to_last_modified(self):
+        """
+        Confirm that the last modified time is used when there is no ETag
+        to compare against.
+        """
+        future_time = self.time + datetime.timedelta(days=1)
+        src_file = self.local_file('upload', last_update=future_time)
+        self.assertTrue(self.sync_strategy.determine_should_sync(
+            src_file, self.s3_file(None)))
+
+        src_file = self.local_file('upload')
+        self.assertFalse(self.sync_strategy.determine_should_sync(
+            src_file, self.s3_file(None, last_update=future_time)))
+
+    def test_multipart_etag_with_unknown_chunksize_falls_back(self):
+        """
+        Confirm that a multipart ETag whose part count does not match the
+        default chunk size falls back to the last modified time.
+        """
+        future_time = self.time + datetime.timedelta(days=1)
+        src_file = self.local_file('upload')
+        dest_file = self.s3_file('0' * 32 + '-2', last_update=future_time)
+        self.assertFalse(
+            self.sync_strategy.determine_should_sync(src_file, dest_file))
+
+    def test_local_file_removed_falls_back(self):
+        """
+        Confirm that a local file removed after listing falls back to the
+        last modified time instead of raising.
+        """
+        os.remove(self.local_path)
+        future_time = self.time + datetime.timedelta(days=1)
+        src_file = self.local_file('upload')
+        dest_file = self.s3_file('0' * 32, last_update=future_time)
+        self.assertFalse(
+            self.sync_strategy.determine_should_sync(src_file, dest_file))
+
+    def test_md5_unavailable_falls_back(self):
+        future_time = self.time + datetime.timedelta(days=1)
+        src_file = self.local_file('upload')
+        dest_file = self.s3_file('0' * 32, last_update=future_time)
+        with mock.patch(
+                'awscli.customizations.s3.syncstrategy.etag.get_md5',
+                side_effect=MD5UnavailableError):
+            self.assertFalse(
+                self.sync_strategy.determine_should_sync(src_file, dest_file))
+
+    def test_multipart_etag_with_default_chunksize(self):
+        contents = b'a' * (8 * MB) + b'foo'
+        self.local_path = self.files.create_file(
+            'large.txt', contents, mode='wb')
+        src_file = self.local_file('upload', size=len(contents))
+        self.assertFalse(self.sync_strategy.determine_should_sync(
+            src_file,
+            self.s3_file(multipart_etag(contents, 8 * MB),
+                         size=len(contents))))
+        self.assertTrue(self.sync_strategy.determine_should_sync(
+            src_file,
+            self.s3_file(multipart_etag(b'b' + contents[1:], 8 * MB),
+                         size=len(contents))))
+
+    def test_multipart_etag_with_configured_chunksize(self):
+        session = mock.Mock()
+        session.get_scoped_config.return_value = {
+            's3': {'multipart_chunksize': '6MB'}}
+        self.sync_strategy.register_strategy(session)
+        contents = b'a' * (6 * MB) + b'foo'
+        self.local_path = self.files.create_file(
+            'large.txt', contents, mode='wb')
+        src_file = self.local_file('upload', size=len(contents))
+        dest_file = self.s3_file(multipart_etag(contents, 6 * MB),
+                                 size=len(contents))
+        self.assertFalse(
+            self.sync_strategy.determine_should_sync(src_file, dest_file))
+
+    def test_multipart_chunksize_defaults_without_session(self):
+        self.assertEqual(self.sync_strategy.multipart_chunksize, 8 * MB)
+
+    def test_mpu_etag(self):
+        part_digests = [hashlib.md5(b'foo').digest(),
+                        hashlib.md5(b'bar').digest()]
+        expected = '%s-2' % hashlib.md5(b''.join(part_digests)).hexdigest()
+        self.assertEqual(_mpu_etag(self.local_path, 3), expected)
+
+    def test_mpu_etag_with_partial_last_part(self):
+        part_digests = [hashlib.md5(b'foob').digest(),
+                        hashlib.md5(b'ar').digest()]
+        expected = '%s-2' % hashlib.md5(b''.join(part_digests)).hexdigest()
+        self.assertEqual(_mpu_etag(self.local_path, 4), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
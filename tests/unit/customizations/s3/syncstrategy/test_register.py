@@ -10,8 +10,9 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+from awscli.customizations.s3.syncstrategy.etag import ETagSync
 from awscli.customizations.s3.syncstrategy.register import \
-    register_sync_strategy
+    register_sync_strategy, register_sync_strategies
 from awscli.testutils import mock, unittest
 
 
@@ -47,5 +48,15 @@ class TestRegisterSyncStrategy(unittest.TestCase):
         self.strategy_object.register_strategy.assert_called_with(self.session)
 
 
+class TestRegisterSyncStrategies(unittest.TestCase):
+    def test_registers_etag_sync(self):
+        session = mock.Mock()
+        with mock.patch('awscli.customizations.s3.syncstrategy.register.'
+                        'register_sync_strategy') as mock_register:
+            register_sync_strategies({}, session)
+        self.assertIn(mock.call(session, ETagSync),
+                      mock_register.call_args_list)
+
+
 if __name__ == "__main__":
     unittest.main()